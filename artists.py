@@ -11,6 +11,9 @@ Dec 31th, 2023 - Louis Servaes
 """
 
 # .................{ IMPORTS                                  }................
+import sys
+from collections.abc import Iterator
+
 import matplotlib as mpl
 import matplotlib.colors as mcolors
 import numpy as np
@@ -24,11 +27,16 @@ class Artist:
     under an identity.
     """
     # ...............{ CLASS VARIABLES                          }..............
-    # dictionary containing all valid colors (str) (from matplotlib.colors)
+    # set containing all valid colors (str) (from matplotlib.colors)
     COLOR_OPTIONS = (
-        mcolors.BASE_COLORS | mcolors.TABLEAU_COLORS | mcolors.CSS4_COLORS
+        frozenset(mcolors.BASE_COLORS)
+        | frozenset(mcolors.TABLEAU_COLORS)
+        | frozenset(mcolors.CSS4_COLORS)
     )
 
+    # instance attributes, stored without a per-instance __dict__
+    __slots__ = ('_xdata', '_ydata', '_name')
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -36,7 +44,9 @@ class Artist:
         y, 
         name: str
     ):
-        """Initializes the Artist.
+        """Initializes the Artist. A contiguous float numpy.ndarray `x` or 
+        `y` is stored as a view, not as a copy, so changing it in place 
+        afterwards also changes the Artist `xdata` or `ydata`.
 
         Parameters
         ---
@@ -49,8 +59,8 @@ class Artist:
         name : str
             The Artist identity or `name`.
         """
-        xdata = np.array(x, dtype=float).flatten()
-        ydata = np.array(y, dtype=float).flatten()
+        xdata = _as_float1d(x)
+        ydata = _as_float1d(y)
         assert xdata.size == ydata.size, (
             'Tried to initialize Artist, but `x` and `y` don\'t have the '
             'same size.'
@@ -112,17 +122,20 @@ class Line(Artist):
     data under an identity.
     """
     # ...............{ CLASS VARIABLES                          }..............
-    # linestyle options (str) (from matplotlib)
-    LS_OPTIONS = {
+    # linestyle options (str) (from matplotlib), interned so that membership
+    # checks against literal arguments resolve by identity
+    LS_OPTIONS = frozenset(map(sys.intern, (
         'solid',
         'dashed',
         'dotted',
         'dashdot',
         '-',
-        '--'
+        '--',
         ':',
         '-.'
-    }
+    )))
+
+    __slots__ = ('_c', '_lw', '_ls')
 
     # ...............{ DUNDERS                                  }..............
     def __init__(
@@ -168,7 +181,8 @@ class Line(Artist):
         
     def set_color(self, c: str):
         """Sets the Artist `color`."""
-        assert c in Artist.COLOR_OPTIONS, e.OptionsError('Line', 'c')
+        if c not in _COLOR_OPTIONS:
+            raise AssertionError(e.OptionsError('Line', 'c'))
         self._c = c
         return c
     
@@ -187,9 +201,10 @@ class Line(Artist):
     
     def set_linestyle(self, ls: str):
         """Sets the Artist `linestyle`."""
-        assert ls in Line.LS_OPTIONS, e.OptionsError(
-            'Line', 'ls', options=Line.LS_OPTIONS
-        )
+        if ls not in _LS_OPTIONS:
+            raise AssertionError(e.OptionsError(
+                'Line', 'ls', options=_LS_OPTIONS
+            ))
         self._ls = ls
         return ls
     
@@ -198,6 +213,9 @@ class Straight(Line):
     """Artist subclass for storing and keeping track of 2D straight-type
     visual data under an identity.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    __slots__ = ('_dx', '_dy')
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -246,6 +264,9 @@ class Points(Artist):
     """Artist subclass for storing and keeping track of 2D point-type visual 
     data under an identity.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    __slots__ = ('_c', '_s', '_t', '_ms', '_mpl_s')
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -285,6 +306,14 @@ class Points(Artist):
         self.set_size(s)
         self._t = t
 
+    # ...............{ PRIVATE METHODS                          }..............
+    # caches the matplotlib size, which depends on the markersize rcParam
+    def _update_mpl_size(self):
+        self._ms = mpl.rcParams['lines.markersize']
+        ms = float(self._ms)
+        # scalar factor first, so an array `size` is only traversed once
+        self._mpl_s = self._s * (ms * ms * 0.25)
+
     # ...............{ PROPERTIES                               }..............
     def get_color(self):
         """Gets the Artist `color`."""
@@ -292,12 +321,14 @@ class Points(Artist):
 
     def set_color(self, c):
         """Sets the Artist `color`. If an Iterable[int | float] is passed, the 
-        size must match the Artist `xdata` and `ydata` size.
+        size must match the Artist `xdata` and `ydata` size. A contiguous 
+        float numpy.ndarray is stored as a view, not as a copy.
         """
         if isinstance(c, str):
-            assert c in Artist.COLOR_OPTIONS, e.OptionsError('Points', 'c')
+            if c not in _COLOR_OPTIONS:
+                raise AssertionError(e.OptionsError('Points', 'c'))
         else:
-            c = np.array(c, dtype=float).flatten()
+            c = _as_float1d(c)
             assert c.size == self._xdata.size, (
                 'Tried to set Points `color`, but `c` doesn\'t have the same '
                 'size as `x` and `y`.'
@@ -312,21 +343,27 @@ class Points(Artist):
     
     def set_size(self, s):
         """Sets the Artist `size`. If an Iterable[int | float] is passed, the 
-        size must match the Artist `xdata` and `ydata` size.
+        size must match the Artist `xdata` and `ydata` size. A contiguous 
+        float numpy.ndarray is stored as a view, not as a copy.
         """
-        if not isinstance(s, int | float):
-            s = np.array(s, dtype=float).flatten()
+        if np.isscalar(s) or getattr(s, 'ndim', None) == 0:
+            s = float(s)
+        else:
+            s = _as_float1d(s)
             assert s.size == self._xdata.size, (
                 'Tried to set Points `size`, but `s` doesn\'t have the same '
                 'size as `x` and `y`.'
             )
 
         self._s = s
+        self._update_mpl_size()
         return s
     
     def get_mpl_size(self):
         """Gets the matplotlib.collections.Pathcollection size."""
-        return self._s * mpl.rcParams['lines.markersize']**2 / 4
+        if self._ms != mpl.rcParams['lines.markersize']:
+            self._update_mpl_size()
+        return self._mpl_s
 
     def get_type(self):
         """Gets the Artist `type`."""
@@ -334,7 +371,8 @@ class Points(Artist):
 
 
 class Arrows(Artist):
-    PIVOT_OPTIONS = {'tip', 'mid', 'tail'}
+    PIVOT_OPTIONS = frozenset(map(sys.intern, ('tip', 'mid', 'tail')))
+    __slots__ = ('_u', '_v', '_c', '_pivot')
 
     def __init__(
         self,
@@ -346,23 +384,47 @@ class Arrows(Artist):
         c=0,
         pivot: str = 'mid'
     ):
+        """Initializes the Artist. Like `x` and `y`, a contiguous float 
+        numpy.ndarray `u`, `v` or `c` is stored as a view, not as a copy, so 
+        changing it in place afterwards also changes the Artist.
+
+        Parameters
+        ---
+        x, y : Iterable[int | float]
+            The Artist `xdata` and `ydata`, the positions of the arrows.
+
+        u, v : Iterable[int | float]
+            The Artist `dir`, the directions of the arrows. `u` and `v` must 
+            have the same size as `x` and `y`.
+
+        name : str
+            The Artist identity or `name`.
+
+        c : int | float | Iterable[int | float] (optional)
+            The Artist `color`, mapped to a colormap. Default is 0.
+
+        pivot : str (optional)
+            The Artist `pivot`. Valid options are \'tip\', \'mid\' and 
+            \'tail\'. Default is \'mid\'.
+        """
         super().__init__(x, y, name)
 
-        u = np.array(u, dtype=float).flatten()
-        v = np.array(v, dtype=float).flatten()
+        u = _as_float1d(u)
+        v = _as_float1d(v)
         assert u.size == v.size == self._xdata.size, (
             'Tried to initialize Arrows, but `u` and `v` don\'t have the '
             'same size as `x` and `y`.'
         )
 
-        self._uv = np.vstack((u, v))
+        self._u = u
+        self._v = v
         self.set_color(c)
         self._pivot = pivot
 
     # ...............{ PROPERTIES                               }..............
     def get_dir(self):
-        """Gets the Artist `dir`."""
-        return self._uv
+        """Gets the Artist `dir` as a tuple of two 1D arrays `u` and `v`."""
+        return self._u, self._v
     
     def get_color(self):
         """Gets the Artist `color`."""
@@ -370,10 +432,13 @@ class Arrows(Artist):
 
     def set_color(self, c):
         """Sets the Artist `color`. If an Iterable[int | float] is passed, the 
-        size must match the Artist `xdata` and `ydata` size.
+        size must match the Artist `xdata` and `ydata` size. A contiguous 
+        float numpy.ndarray is stored as a view, not as a copy.
         """
-        if not isinstance(c, int | float):
-            c = np.array(c, dtype=float).flatten()
+        if np.isscalar(c) or getattr(c, 'ndim', None) == 0:
+            c = float(c)
+        else:
+            c = _as_float1d(c)
             assert c.size == self._xdata.size, (
                 'Tried to set Arrows `color`, but `c` doesn\'t have the same '
                 'size as `x` and `y`.'
@@ -390,9 +455,10 @@ class Arrows(Artist):
         """Sets the Artist `pivot`. Options are \'tip\', \'mid\' and 
         \'tail\'.
         """
-        assert pivot in Arrows.PIVOT_OPTIONS, e.OptionsError(
-            'Arrows', 'pivot', Arrows.PIVOT_OPTIONS
-        )
+        if pivot not in _PIVOT_OPTIONS:
+            raise AssertionError(e.OptionsError(
+                'Arrows', 'pivot', _PIVOT_OPTIONS
+            ))
         self._pivot = pivot
         return pivot
 
@@ -409,6 +475,8 @@ class Text(Artist):
         'fraction': 'axes fraction'
     }
 
+    __slots__ = ('_text', '_c', '_s', '_coord_type', '_mpl_coord', '_offset')
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -473,7 +541,8 @@ class Text(Artist):
     
     def set_color(self, c: str):
         """Sets the Artist `color`."""
-        assert c in Artist.COLOR_OPTIONS, e.OptionsError('Text', 'c')
+        if c not in _COLOR_OPTIONS:
+            raise AssertionError(e.OptionsError('Text', 'c'))
         self._c = c
         return c
     
@@ -494,11 +563,19 @@ class Text(Artist):
         """Sets the Artist `coord_type`. Valid options are \'data\' and 
         \'fraction\'.
         """
-        assert coord_type in Text.COORD_OPTIONS, e.OptionsError(
-            'Text', 'coord_type', options=Text.COORD_OPTIONS
-        )
+        if coord_type not in _COORD_OPTIONS:
+            raise AssertionError(e.OptionsError(
+                'Text', 'coord_type', options=_COORD_OPTIONS
+            ))
         self._coord_type = coord_type
+        self._mpl_coord = _COORD_OPTIONS[coord_type]
         return coord_type
+
+    def get_mpl_coord(self):
+        """Gets the matplotlib.text.Annotation `xycoords` matching the Artist 
+        `coord_type`.
+        """
+        return self._mpl_coord
     
     def get_offset(self):
         """Gets the Artist text `offset` in points."""
@@ -507,4 +584,79 @@ class Text(Artist):
     def set_offset(self, offset):
         """Sets the Artist text `offset` in points."""
         self._offset = offset
-        return offset
\ No newline at end of file
+        return offset
+
+
+# .................{ FUNCTIONS                                }................
+def lines_from_batch(
+    xs, 
+    ys, 
+    names, 
+    c: str = 'k', 
+    lw: int | float = 1.0, 
+    ls: str = 'solid'
+):
+    '''Initialize one Line per `x`, `y` and `name`, all sharing the same 
+    style. The style is only validated once for the whole batch.
+
+    Parameters
+    ---
+    xs : Iterable[Iterable[int | float]]
+        The `xdata` of each Line.
+
+    ys : Iterable[Iterable[int | float]]
+        The `ydata` of each Line.
+
+    names : Iterable[str]
+        The identity or `name` of each Line.
+
+    c : str (optional):
+        The Lines `color`. Default is black.
+
+    lw : int | float (optional)
+        The Lines `linewidth`. Default is 1.0.
+
+    ls : str (optional)
+        The Lines `linestyle`. Default is solid.
+
+    Returns
+    ---
+    list[Line]
+        The Lines, in the order of `names`.
+    '''
+
+    if c not in _COLOR_OPTIONS:
+        raise AssertionError(e.OptionsError('Line', 'c'))
+    if ls not in _LS_OPTIONS:
+        raise AssertionError(e.OptionsError(
+            'Line', 'ls', options=_LS_OPTIONS
+        ))
+
+    lines = []
+    for x, y, name in zip(xs, ys, names, strict=True):
+        line = Line.__new__(Line)
+        Artist.__init__(line, x, y, name)
+        line._c = c
+        line._lw = lw
+        line._ls = ls
+        lines.append(line)
+    return lines
+
+
+def _as_float1d(x):
+    '''Convert `x` to a flat float numpy.ndarray. A contiguous float 
+    numpy.ndarray is returned as a view, and an Iterator is consumed in a 
+    single pass.'''
+
+    if isinstance(x, Iterator):
+        return np.fromiter(x, dtype=float)
+    return np.asarray(x, dtype=float).ravel()
+
+
+# .................{ CONSTANTS                                }................
+# module-level aliases of the class option sets, so that the setters resolve 
+# them with a single global lookup
+_COLOR_OPTIONS = Artist.COLOR_OPTIONS
+_LS_OPTIONS = Line.LS_OPTIONS
+_PIVOT_OPTIONS = Arrows.PIVOT_OPTIONS
+_COORD_OPTIONS = Text.COORD_OPTIONS
\ No newline at end of file
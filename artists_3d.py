@@ -8,9 +8,7 @@ Jan 19th, 2023 - Louis Servaes
 """
 
 # .................{ IMPORTS                                  }................
-import numpy as np
-
-from pygraph.artists import Artist, Line, Points, Text
+from pygraph.artists import Artist, Line, Points, Text, _as_float1d
 
 
 # .................{ CLASSES                                  }................
@@ -18,6 +16,11 @@ class Artist3D(Artist):
     """Virtual base class for storing and keeping track of 3D visual data 
     under an identity. Inherits from the pygraph.artists.Artist class.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    # `_zdata` is declared by the concrete subclasses, since two bases that
+    # both declare slots can't be combined (e.g. Artist3D and Line in Line3D)
+    __slots__ = ()
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -26,7 +29,9 @@ class Artist3D(Artist):
         z, 
         name: str
     ):
-        """Initializes the Artist.
+        """Initializes the Artist. A contiguous float numpy.ndarray `x`, `y`
+        or `z` is stored as a view, not as a copy, so changing it in place 
+        afterwards also changes the Artist `xdata`, `ydata` or `zdata`.
 
         Parameters
         ---
@@ -42,13 +47,17 @@ class Artist3D(Artist):
         name : str
             The Artist identity or `name`.
         """
-        Artist.__init__(self, x, y, name)
-        zdata = np.array(z, dtype=float).flatten()
-        assert self._xdata.size == zdata.size, (
-            'Tried to initialize Artist, but `x` and `z` don\'t have the '
-            'same size.'
+        xdata = _as_float1d(x)
+        ydata = _as_float1d(y)
+        zdata = _as_float1d(z)
+        assert xdata.size == ydata.size == zdata.size, (
+            'Tried to initialize Artist, but `x`, `y` and `z` don\'t have '
+            'the same size.'
         )
+        self._xdata = xdata
+        self._ydata = ydata
         self._zdata = zdata
+        self.set_name(name)
 
     # ...............{ PROPERTIES                               }..............
     def get_zdata(self):
@@ -60,6 +69,9 @@ class Line3D(Artist3D, Line):
     """Artist subclass for storing and keeping track of 3D line-type visual 
     data under an identity.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    __slots__ = ('_zdata',)
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -106,6 +118,9 @@ class Points3D(Artist3D, Points):
     """Artist subclass for storing and keeping track of 3D point-type visual 
     data under an identity.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    __slots__ = ('_zdata',)
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -151,6 +166,9 @@ class Text3D(Artist3D, Text):
     """Artist subclass for storing and keeping track of 3D text-type visual 
     data under an identity.
     """
+    # ...............{ CLASS VARIABLES                          }..............
+    __slots__ = ('_zdata',)
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self, 
@@ -1,8 +1,13 @@
 class _Error:
-    def __init__(self, msg):
+    def __init__(self, msg: str = None):
         self._msg = msg
-    
+
+    # subclasses without a message define _format instead, so their message
+    # is only formatted when the error is actually displayed, and formatted
+    # at most once
     def __str__(self):
+        if self._msg is None and hasattr(self, '_format'):
+            self._msg = self._format()
         return self._msg
 
 
@@ -11,17 +16,29 @@ class OptionsError(_Error):
         self, 
         cls: str, 
         arg: str, 
-        options: set | dict = None, 
+        options: set | frozenset | dict = None, 
         add_msg: str = ''
     ):
-        msg = f'Tried to set {cls} `{arg}`, but `{arg}` is an invalid option. '
-        if options is not None:
+        super().__init__()
+        self._cls = cls
+        self._arg = arg
+        self._options = options
+        self._add_msg = add_msg
+
+    def _format(self):
+        arg = self._arg
+        msg = (
+            f'Tried to set {self._cls} `{arg}`, but `{arg}` is an invalid '
+            'option. '
+        )
+        if self._options is not None:
             msg = (
                 msg 
-                + f' `{arg}` must take one of the following values: {options} '
+                + f' `{arg}` must take one of the following values: '
+                + f'{set(self._options)} '
             )
-        
-        super().__init__(msg + add_msg)
+
+        return msg + self._add_msg
 
 
 class IndexError(_Error):
@@ -34,11 +51,22 @@ class IndexError(_Error):
         overwrite: bool = False,
         add_msg: str = ''
     ):
+        super().__init__()
+        self._cls = cls
+        self._arg = arg
+        self._idx = idx
+        self._action = action
+        self._overwrite = overwrite
+        self._add_msg = add_msg
+
+    def _format(self):
+        arg = self._arg
+        action = self._action
         if action is None:
-            action = f'add `{arg}` to {cls}'
+            action = f'add `{arg}` to {self._cls}'
 
-        msg = f'Tried to {action}, but `{idx}` '
-        if overwrite:
+        msg = f'Tried to {action}, but `{self._idx}` '
+        if self._overwrite:
             msg = (
                 msg
                 + 'is already displayed or taken. '
@@ -48,4 +76,4 @@ class IndexError(_Error):
         else:
             msg = msg + 'wasn\'t found. ' 
 
-        super().__init__(msg + add_msg)
\ No newline at end of file
+        return msg + self._add_msg
\ No newline at end of file
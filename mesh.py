@@ -30,10 +30,10 @@ class ColorMesh:
             The ColorMesh `color`. `C` must have the same shape as `X` and 
             `Y`.
         """
-        assert len(np.shape(X)) == 2, (
+        assert X.ndim == 2, (
             'Tried to initialize ColorMesh, but `X` isn\'t 2 dimensional.'
         )
-        assert np.shape(X) == np.shape(Y) == np.shape(C), (
+        assert X.shape == Y.shape == C.shape, (
             'Tried to initialize ColorMesh, but `X`, `Y` and `C` don\'t have '
             'the same shape.'
         )
@@ -41,6 +41,8 @@ class ColorMesh:
         self._Y = Y
         self._C = C
         self._cmap = cmap
+        # (min, max) of `color`, computed on first access
+        self._color_range = None
         
     # ...............{ PUBLIC METHODS                           }..............
     def draw(
@@ -78,6 +80,12 @@ class ColorMesh:
     def get_color(self):
         """Gets the ColorMesh `color`."""
         return self._C
+
+    def get_color_range(self):
+        """Gets the minimum and maximum of the ColorMesh `color`."""
+        if self._color_range is None:
+            self._color_range = (np.min(self._C), np.max(self._C))
+        return self._color_range
     
     def get_cmap(self):
         """Gets the ColorMesh `cmap`."""
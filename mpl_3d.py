@@ -20,7 +20,6 @@ import numpy as np
 from matplotlib.patches import FancyArrowPatch
 from matplotlib.text import Annotation
 from mpl_toolkits.mplot3d.axes3d import Axes3D
-from mpl_toolkits.mplot3d.proj3d import proj_transform
 
 
 # .................{ CLASSES                                  }................
@@ -28,11 +27,16 @@ class _MPLAnnotation3D(Annotation):
 
     def __init__(self, text, xyz, *args, **kwargs):
         super().__init__(text, xy=(0, 0), *args, **kwargs)
-        self._xyz = xyz
+        # homogeneous coordinates of the annotation
+        self._vec = np.array([*xyz, 1], dtype=float)
+        # projection matrix for which `xy` was last computed
+        self._proj_M = None
 
     def draw(self, renderer):
-        x2, y2, z2 = proj_transform(*self._xyz, self.axes.M)
-        self.xy = (x2, y2)
+        # Axes3D creates a new projection matrix on every draw, so the first
+        # annotation drawn in a frame projects all annotations of the axes
+        if self._proj_M is not self.axes.M:
+            _proj_annotations(self.axes)
         super().draw(renderer)
 
 
@@ -40,30 +44,59 @@ class _MPLArrow3D(FancyArrowPatch):
 
     def __init__(self, x, y, z, dx, dy, dz, *args, **kwargs):
         super().__init__((0, 0), (0, 0), *args, **kwargs)
-        self._xyz = (x, y, z)
-        self._dxdydz = (dx, dy, dz)
+        # homogeneous coordinates of the arrow tail (column 0) and head 
+        # (column 1), so both are projected with a single matrix product
+        self._vec = np.array([
+            [x, x + dx],
+            [y, y + dy],
+            [z, z + dz],
+            [1, 1]
+        ], dtype=float)
+        # projection matrix for which the positions were last computed
+        self._proj_M = None
 
     def draw(self, renderer):
-        x1, y1, z1 = self._xyz
-        dx, dy, dz = self._dxdydz
-        x2, y2, z2 = (x1 + dx, y1 + dy, z1 + dz)
-
-        xs, ys, zs = proj_transform((x1, x2), (y1, y2), (z1, z2), self.axes.M)
-        self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
+        # positions are already up to date when do_3d_projection was called 
+        # earlier in the same frame
+        if self._proj_M is not self.axes.M:
+            self._project()
         super().draw(renderer)
 
     def do_3d_projection(self, renderer=None):
-        x1, y1, z1 = self._xyz
-        dx, dy, dz = self._dxdydz
-        x2, y2, z2 = (x1 + dx, y1 + dy, z1 + dz)
+        return self._project()
 
-        xs, ys, zs = proj_transform((x1, x2), (y1, y2), (z1, z2), self.axes.M)
+    # projects the tail and head, and returns the smallest depth
+    def _project(self):
+        M = self.axes.M
+        xs, ys, zs = _proj_points(self._vec, M)
         self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
+        self._proj_M = M
 
         return np.min(zs)
     
 
 # .................{ FUNCTIONS                                }................
+def _proj_points(vec, M):
+    '''Project the homogeneous points `vec` (4xN) with the projection matrix 
+    `M`.'''
+
+    vecw = M @ vec
+    return vecw[:3] / vecw[3]
+
+
+def _proj_annotations(ax):
+    '''Project all 3D annotations of an `Axes3D` instance at once.'''
+
+    annotations = [
+        text for text in ax.texts if isinstance(text, _MPLAnnotation3D)
+    ]
+    vec = np.array([annotation._vec for annotation in annotations]).T
+    xs, ys, zs = _proj_points(vec, ax.M)
+    for annotation, x, y in zip(annotations, xs, ys):
+        annotation.xy = (x, y)
+        annotation._proj_M = ax.M
+
+
 def _annotate3D(ax, text, xyz, *args, **kwargs):
     '''Add anotation `text` to an `Axes3d` instance.'''
 
@@ -16,6 +16,9 @@ Jan 18th, 2023 - Louis Servaes
 
 
 # .................{ IMPORTS                                  }................
+from contextlib import contextmanager
+
+import matplotlib.artist as martist
 import matplotlib.cm as cm
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
@@ -23,13 +26,10 @@ import numpy as np
 
 import pygraph.errors as e
 from pygraph.artists import Arrows, Artist, Line, Points, Straight, Text
-from pygraph.artists_3d import Artist3D, Line3D, Points3D, Text3D
+from pygraph.artists_3d import Line3D, Points3D, Text3D
 from pygraph.mesh import ColorMesh
 from pygraph.mpl_3d import configure_3d_artists
 
-# .................{ CONFIGURATION                            }................
-configure_3d_artists()
-
 
 # .................{ CLASSES                                  }................
 class Window:
@@ -55,48 +55,97 @@ class Window:
             nrows, 
             ncols, 
             figsize=windowsize, 
-            subplot_kw={'projection': mpl_proj}
+            subplot_kw={'projection': mpl_proj},
+            layout='constrained'
         )
+        # the padding is given in fractions of the font size, like for 
+        # matplotlib.pyplot.tight_layout, but constrained layout takes inches
+        pad = figure_padding * plt.rcParams['font.size'] / 72
+        mpl_fig.get_layout_engine().set(w_pad=pad, h_pad=pad)
 
         self._mpl_fig = mpl_fig
         self._mpl_axs = mpl_axs
         self._figures = self._create_figures(
             mpl_fig, mpl_axs, figure_projection
         )
+        # flat view of the figures, to iterate them regardless of the layout
+        self._figures_flat = (
+            self._figures.ravel() if isinstance(self._figures, np.ndarray) 
+            else (self._figures,)
+        )
         self._figure_projection = figure_projection
+        self._figure_padding = figure_padding
+        # canvas regions of the figures without their animated artists, 
+        # captured on every full draw once blitting is started
+        self._backgrounds = None
+        self._blit_cid = None
 
         mpl_fig.suptitle(title)
-        plt.tight_layout(pad=figure_padding)
 
     # ...............{ PRIVATE METHODS                          }..............
     # initializes the figures when Window is initialized
     def _create_figures(self, mpl_fig, mpl_axs, figure_projection):
-        match figure_projection:
-            case '2d':
-                if not isinstance(mpl_axs, np.ndarray):
-                    return Figure(mpl_fig, mpl_axs)
-
-                figures = []
-                for mpl_ax in mpl_axs.flatten():
-                    figures.append(Figure(mpl_fig, mpl_ax))
-                return np.reshape(figures, np.shape(mpl_axs))
-            
-            case '3d':
-                if not isinstance(mpl_axs, np.ndarray):
-                    return Figure3D(mpl_fig, mpl_axs)
-
-                figures = []
-                for mpl_ax in mpl_axs.flatten():
-                    figures.append(Figure3D(mpl_fig, mpl_ax))
-                return np.reshape(figures, np.shape(mpl_axs))
-            
-        raise NotImplementedError()
+        figure_cls = {'2d': Figure, '3d': Figure3D}.get(figure_projection)
+        if figure_cls is None:
+            raise NotImplementedError()
+
+        if not isinstance(mpl_axs, np.ndarray):
+            return figure_cls(mpl_fig, mpl_axs)
+
+        figures = np.empty(mpl_axs.shape, dtype=object)
+        for i, mpl_ax in enumerate(mpl_axs.flat):
+            figures.flat[i] = figure_cls(mpl_fig, mpl_ax)
+        return figures
+
+    # captures the figure backgrounds after a full draw, and draws the 
+    # animated artists on top, since a full draw skips them
+    def _on_draw(self, event):
+        canvas = self._mpl_fig.canvas
+        self._backgrounds = [
+            canvas.copy_from_bbox(figure.get_mpl_ax().bbox) 
+            for figure in self._figures_flat
+        ]
+        for figure in self._figures_flat:
+            figure.draw_animated()
 
     # ...............{ PUBLIC METHODS                           }..............
+    # +-----------------------------------------------------------------------+
+    # Starts blitting, after which blit_update only redraws the animated 
+    # artists (see Figure.set_animated) instead of the whole Window. The 
+    # backgrounds are captured again on every full draw, e.g. after a resize.
+    # +-----------------------------------------------------------------------+
+    def start_blit(self):
+        canvas = self._mpl_fig.canvas
+        assert canvas.supports_blit, (
+            'Tried to start blitting, but the matplotlib backend doesn\'t '
+            'support blitting.'
+        )
+        if self._blit_cid is None:
+            self._blit_cid = canvas.mpl_connect('draw_event', self._on_draw)
+        canvas.draw()
+
+    def blit_update(self):
+        assert self._backgrounds is not None, (
+            'Tried to update the Window by blitting, but blitting wasn\'t '
+            'started. Use Window.start_blit first.'
+        )
+        canvas = self._mpl_fig.canvas
+        for figure, background in zip(
+            self._figures_flat, self._backgrounds
+        ):
+            canvas.restore_region(background)
+            figure.draw_animated()
+            canvas.blit(figure.get_mpl_ax().bbox)
+        canvas.flush_events()
+
     def show(self):
         if self._figure_projection == '2d':
-            for figure in np.array(self._figures).flatten():
+            for figure in self._figures_flat:
                 figure.update_scale()
+        # without a layout engine (e.g. removed by the user), the layout is
+        # adjusted once now that all artists are added
+        if self._mpl_fig.get_layout_engine() is None:
+            self._mpl_fig.tight_layout(pad=self._figure_padding)
         plt.show()
 
     def soft_destroy(self):
@@ -114,9 +163,16 @@ class Window:
     
     def get_figure_projection(self):
         return self._figure_projection
+
+    def get_figure_padding(self):
+        return self._figure_padding
     
 
 class _Figure:
+    # ...............{ CLASS VARIABLES                          }..............
+    # dictionary mapping Artist classes to the name of the method drawing them
+    _MPL_ADD_METHODS = {}
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self,
@@ -130,17 +186,46 @@ class _Figure:
         self._mpl_ax = mpl_ax
         self._mpl_artists = {}
         self._artists = {}
+        # names of the Artists of type Text, which can't be added to the Legend
+        self._text_names = set()
         self._color_mesh = None
 
-        mpl_ax.set_xlabel(xlabel)
-        mpl_ax.set_ylabel(ylabel)
-        mpl_ax.set_title(title)
+        # empty labels and title are left unset
+        mpl_ax.set(**{
+            key: value 
+            for key, value in (
+                ('xlabel', xlabel), ('ylabel', ylabel), ('title', title)
+            ) 
+            if value
+        })
 
-        self.legend = Legend(self)
+        # the Legend is only created once it is used, see _Figure.legend
+        self._legend = None
 
     # ...............{ PRIVATE METHODS                          }..............
+    # draws an Artist with the method mapped to its class, or else to its 
+    # closest parent class
     def _add_mpl_artist(self, artist: Artist, label: str):
+        for cls in type(artist).__mro__:
+            if cls in self._MPL_ADD_METHODS:
+                getattr(self, self._MPL_ADD_METHODS[cls])(artist, label)
+                return
         raise NotImplementedError()
+
+    def _remove_mpl_artist(self, name: str):
+        mpl_artist = self._mpl_artists.pop(name)
+        mpl_artist.remove()
+
+    # makes `name` available for a new Artist, removing the Artist displayed
+    # under it when overwriting
+    def _free_name(self, name: str, overwrite: bool):
+        if name in self._artists:
+            if overwrite:
+                self.remove_artist(name)
+            else:
+                raise AssertionError(e.IndexError(
+                    'Figure', 'artist', overwrite=True
+                ))
     
     # ...............{ PUBLIC METHODS                           }..............
     def soft_destroy(self):
@@ -154,28 +239,23 @@ class _Figure:
     ):
 
         name = artist.get_name()
-        
-        if name in self._artists:
-            if overwrite:
-                self.remove_artist(name)
-            else:
-                raise AssertionError(e.IndexError(
-                    'Figure', 'artist', overwrite=True
-                ))
+        self._free_name(name, overwrite)
             
         if not label:
             label = name
 
         self._add_mpl_artist(artist, label)
         self._artists[name] = artist
+        if isinstance(artist, Text):
+            self._text_names.add(name)
 
     def remove_artist(self, name: str):
         assert name in self._artists, e.IndexError(
             'Figure', 'artist', action='remove Artist from Figure'
         )
         self._artists.pop(name)
-        mpl_artist = self._mpl_artists.pop(name)
-        mpl_artist.remove()
+        self._text_names.discard(name)
+        self._remove_mpl_artist(name)
 
     def set_visible(self, name: str, visibility: bool = True):
         assert name in self._artists, e.IndexError(
@@ -183,6 +263,20 @@ class _Figure:
         )
         self._mpl_artists[name].set_visible(visibility)
 
+    # animated artists are skipped by a full draw, and are only drawn by 
+    # draw_animated (see Window.start_blit and Window.blit_update)
+    def set_animated(self, name: str, animated: bool = True):
+        assert name in self._artists, e.IndexError(
+            'Figure', 'artist', action='set Artist animated'
+        )
+        self._mpl_artists[name].set_animated(animated)
+
+    def draw_animated(self):
+        # merged Artists share a matplotlib artist, which is only drawn once
+        for mpl_artist in dict.fromkeys(self._mpl_artists.values()):
+            if mpl_artist.get_animated():
+                self._mpl_ax.draw_artist(mpl_artist)
+
     def add_colorbar(self, name: str = None):
         if name is not None:
             assert name in self._artists, e.IndexError(
@@ -192,8 +286,7 @@ class _Figure:
         else:
             artist = self._color_mesh
 
-        data = artist.get_color()
-        norm = mcolors.Normalize(np.min(data), np.max(data))
+        norm = mcolors.Normalize(*artist.get_color_range())
         sm = cm.ScalarMappable(norm, artist.get_cmap())
         self._mpl_fig.colorbar(sm, ax=self._mpl_ax)
 
@@ -206,6 +299,15 @@ class _Figure:
 
     def get_artists(self):
         return self._artists
+
+    def get_text_names(self):
+        return self._text_names
+
+    @property
+    def legend(self):
+        if self._legend is None:
+            self._legend = Legend(self)
+        return self._legend
     
     def get_color_mesh(self):
         return self._color_mesh
@@ -223,6 +325,14 @@ class Figure(_Figure):
     # NOTE: # Figure is scaled once when the Window is shown via Window.show.
     # It is however still possible to manually call update_scale.
 
+    _MPL_ADD_METHODS = {
+        Straight: '_add_mpl_axline',
+        Line: '_add_mpl_line',
+        Points: '_add_mpl_scatter',
+        Arrows: '_add_mpl_quiver',
+        Text: '_add_mpl_annotation',
+    }
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self,
@@ -232,26 +342,35 @@ class Figure(_Figure):
         ylabel='',
         title='',
         autoscale='none',
+        merge=False,
     ):
         super().__init__(mpl_fig, mpl_ax, xlabel, ylabel, title)
         self._mpl_quad_mesh = None
+        # dictionaries mapping a style (tuple) to the matplotlib artist shared
+        # by all merged Artists of that style, and a dictionary mapping their
+        # names to (artist, label, data)
+        self._line_buckets = {}
+        self._scatter_buckets = {}
+        self._quiver_buckets = {}
+        # number of batches added, used to give every batch its own style
+        self._batch_count = 0
+        # dictionary mapping merged Artist names to (buckets, style)
+        self._merged_names = {}
+        # dictionary mapping stale shared matplotlib artists to (buckets, 
+        # style), rebuilt by update_buckets
+        self._stale_buckets = {}
+        # draws before all other artists to call update_buckets, added with 
+        # the first shared matplotlib artist
+        self._mpl_bucket_updater = None
+        # dictionary mapping Artist names to [artist, (x_min, x_max), (y_min, 
+        # y_max)], filled by update_scale (see _cached_bounds)
+        self._artist_bounds = {}
+        # [color_mesh, (x_min, x_max), (y_min, y_max)], filled by update_scale
+        self._mesh_bounds = None
         self.set_autoscale(autoscale)
+        self.set_merge(merge)
         
     # ...............{ PRIVATE METHODS                          }..............
-    def _add_mpl_artist(self, artist: Artist, label: str):
-        if isinstance(artist, Straight):
-            self._add_mpl_axline(artist, label)
-        elif isinstance(artist, Line):
-            self._add_mpl_line(artist, label)
-        elif isinstance(artist, Points):
-            self._add_mpl_scatter(artist, label)
-        elif isinstance(artist, Arrows):
-            self._add_mpl_quiver(artist, label)
-        elif isinstance(artist, Text):
-            self._add_mpl_annotation(artist)
-        else:
-            raise NotImplementedError()
-
     # draws Straight via matplotlib.pyplot.axline
     def _add_mpl_axline(self, straight, label):
         x = straight.get_xdata()[0]
@@ -269,6 +388,28 @@ class Figure(_Figure):
     
     # draws Line via matplotlib.pyplot.plot
     def _add_mpl_line(self, line, label):
+        if self._merge:
+            style = (
+                line.get_color(), 
+                line.get_linewidth(), 
+                line.get_linestyle()
+            )
+            if style not in self._line_buckets:
+                (mpl_line,) = self._mpl_ax.plot(
+                    [], 
+                    [], 
+                    color=line.get_color(), 
+                    linewidth=line.get_linewidth(),
+                    linestyle = line.get_linestyle()
+                )
+                self._new_bucket(self._line_buckets, style, mpl_line)
+            self._add_to_bucket(self._line_buckets, style, line, label)
+            self._mark_stale(self._line_buckets, style)
+            # requests autoscaling on the next draw, like matplotlib does when
+            # adding an artist
+            self._mpl_ax.autoscale(None)
+            return
+
         (mpl_line,) = self._mpl_ax.plot(
             line.get_xdata(), 
             line.get_ydata(), 
@@ -281,6 +422,25 @@ class Figure(_Figure):
 
     # draws Points via matplotlib.pyplot.scatter
     def _add_mpl_scatter(self, points, label):
+        # Points with a color per point are never merged, since matplotlib 
+        # would normalize their colors over the whole merged collection
+        if self._merge and isinstance(points.get_color(), str):
+            style = (points.get_color(), points.get_type())
+            if style not in self._scatter_buckets:
+                mpl_path_collection = self._mpl_ax.scatter(
+                    [], 
+                    [], 
+                    c=points.get_color(), 
+                    marker=points.get_type()
+                )
+                self._new_bucket(
+                    self._scatter_buckets, style, mpl_path_collection
+                )
+            self._add_to_bucket(self._scatter_buckets, style, points, label)
+            self._mark_stale(self._scatter_buckets, style)
+            self._mpl_ax.autoscale(None)
+            return
+
         mpl_path_collection = self._mpl_ax.scatter(
             points.get_xdata(), 
             points.get_ydata(), 
@@ -306,18 +466,131 @@ class Figure(_Figure):
         self._mpl_artists[arrows.get_name()] = mpl_quiver
 
     # draws Text via matplotlib.pyplot.annotate
-    def _add_mpl_annotation(self, text):
+    def _add_mpl_annotation(self, text, label):
         mpl_annotation = self._mpl_ax.annotate(
             text.get_text(),
             (text.get_xdata()[0], text.get_ydata()[0]),
             text.get_offset(),
-            Text.COORD_OPTIONS[text.get_coord_type()],
+            text.get_mpl_coord(),
             'offset points',
             color=text.get_color(),
-            fontsize=text.get_size()
+            fontsize=text.get_size(),
+            label=label
         )
         self._mpl_artists[text.get_name()] = mpl_annotation
 
+    # adds a shared matplotlib artist without Artists
+    def _new_bucket(self, buckets, style, mpl_artist):
+        buckets[style] = (mpl_artist, {})
+        if self._mpl_bucket_updater is None:
+            self._mpl_bucket_updater = _MPLBucketUpdater(self)
+            self._mpl_ax.add_artist(self._mpl_bucket_updater)
+
+    # adds an Artist to the matplotlib artist shared by its style, only 
+    # extending the data limits by its data instead of recomputing them. Its
+    # data is copied, like matplotlib does for artists that aren't merged.
+    def _add_to_bucket(self, buckets, style, artist, label):
+        mpl_artist, members = buckets[style]
+        name = artist.get_name()
+        xdata = artist.get_xdata().copy()
+        ydata = artist.get_ydata().copy()
+        if buckets is self._line_buckets:
+            data = (xdata, ydata)
+        elif buckets is self._scatter_buckets:
+            data = (
+                xdata, 
+                ydata, 
+                np.broadcast_to(artist.get_mpl_size(), xdata.size).copy()
+            )
+        else:
+            u, v = artist.get_dir()
+            data = (
+                xdata, 
+                ydata, 
+                u.copy(), 
+                v.copy(), 
+                np.broadcast_to(artist.get_color(), xdata.size).copy()
+            )
+
+        members[name] = (artist, label, data)
+        self._merged_names[name] = (buckets, style)
+        self._mpl_artists[name] = mpl_artist
+        self._mpl_ax.update_datalim(np.column_stack((xdata, ydata)))
+
+    # defers rebuilding a shared matplotlib artist until update_buckets, so 
+    # adding or removing many Artists only rebuilds it once
+    def _mark_stale(self, buckets, style):
+        mpl_artist, members = buckets[style]
+        # the label of the first remaining Artist labels the shared artist
+        mpl_artist.set_label(next(iter(members.values()))[1])
+        mpl_artist.stale = True
+        self._stale_buckets[mpl_artist] = (buckets, style)
+
+    # removes an Artist from the matplotlib artist shared by its style, and
+    # removes that matplotlib artist once no Artists are left
+    def _remove_mpl_artist(self, name):
+        if name not in self._merged_names:
+            super()._remove_mpl_artist(name)
+            return
+
+        buckets, style = self._merged_names.pop(name)
+        mpl_artist, members = buckets[style]
+        self._mpl_artists.pop(name)
+        members.pop(name)
+        if not members:
+            buckets.pop(style)
+            self._stale_buckets.pop(mpl_artist, None)
+            mpl_artist.remove()
+        elif buckets is self._quiver_buckets:
+            self._update_bucket(buckets, style)
+        else:
+            self._mark_stale(buckets, style)
+
+    # sets the data of a shared matplotlib artist from the data copied from
+    # its Artists, separating merged Lines with nan so they aren't connected
+    def _update_bucket(self, buckets, style):
+        mpl_artist, members = buckets[style]
+        # one tuple per data column, e.g. (xdata of each Artist, ...)
+        columns = tuple(zip(*(data for _, _, data in members.values())))
+
+        if buckets is self._quiver_buckets:
+            mpl_artist = self._replace_mpl_quiver(buckets, style, columns)
+        elif buckets is self._line_buckets:
+            separator = np.array([np.nan])
+            xdata = []
+            ydata = []
+            for x, y in zip(*columns):
+                xdata += [x, separator]
+                ydata += [y, separator]
+            mpl_artist.set_data(
+                np.concatenate(xdata[:-1]), np.concatenate(ydata[:-1])
+            )
+        else:
+            xdata, ydata, sizes = map(np.concatenate, columns)
+            mpl_artist.set_offsets(np.column_stack((xdata, ydata)))
+            mpl_artist.set_sizes(sizes)
+
+        mpl_artist.set_label(next(iter(members.values()))[1])
+        self._stale_buckets.pop(mpl_artist, None)
+
+    # matplotlib.quiver.Quiver can't change its number of arrows, so a shared
+    # Quiver is drawn again from all its Arrows, keeping its visibility
+    def _replace_mpl_quiver(self, buckets, style, columns):
+        old_mpl_quiver, members = buckets[style]
+        arrows = next(iter(members.values()))[0]
+        mpl_quiver = self._mpl_ax.quiver(
+            *map(np.concatenate, columns), pivot=arrows.get_pivot()
+        )
+        if old_mpl_quiver is not None:
+            mpl_quiver.set_visible(old_mpl_quiver.get_visible())
+            mpl_quiver.set_animated(old_mpl_quiver.get_animated())
+            old_mpl_quiver.remove()
+
+        buckets[style] = (mpl_quiver, members)
+        for name in members:
+            self._mpl_artists[name] = mpl_quiver
+        return mpl_quiver
+
     # draws ColorMesh via matplotlib.pyplot.pcolormesh
     def _add_mpl_quad_mesh(self, color_mesh):
         mpl_quad_mesh = self._mpl_ax.pcolormesh(
@@ -328,51 +601,101 @@ class Figure(_Figure):
         )
         self._mpl_quad_mesh = mpl_quad_mesh
     
+    # makes the names of a batch of Artists available, raising before 
+    # anything is added or removed when a name is duplicated or taken
+    def _free_batch_names(self, batch, overwrite):
+        names = [artist.get_name() for artist in batch]
+        assert len(set(names)) == len(names), (
+            'Tried to add a batch of Artists to Figure, but `names` contains '
+            'duplicates. '
+        )
+        # without overwriting this only raises, so nothing is removed before
+        # a taken name is found
+        for name in names:
+            self._free_name(name, overwrite)
+
+    # adds a batch of Artists sharing one matplotlib artist, which is only
+    # updated once all of them are added
+    def _add_batch(self, buckets, mpl_artist, batch, label):
+        self._batch_count += 1
+        style = ('batch', self._batch_count)
+        self._new_bucket(buckets, style, mpl_artist)
+        for artist in batch:
+            name = artist.get_name()
+            self._add_to_bucket(buckets, style, artist, label or name)
+            self._artists[name] = artist
+        self._update_bucket(buckets, style)
+
     # ...............{ PUBLIC METHODS                           }..............
     # +-----------------------------------------------------------------------+
     # Adjusts Figure xlim and ylim when Figure autoscale is not 'none'. It does
-    # this by concatenating all artists xdata and ydata and calculating the min
-    # and max values.
+    # this by reducing the min and max values of all artists xdata and ydata.
+    # The extrema of each artist are cached, so they are only computed once
+    # for every artist that is added. Empty artists are skipped.
     # 
+    # NOTE: Artists may hold the arrays they were created from as views, so
+    # changing those arrays in place isn't noticed by the cache. Call 
+    # Figure.invalidate_bounds after doing so.
+    #
     # NOTE: This should only be called once when the Window is shown via 
     # Window.show, and could throw an error when only artists of type Straight
     # or Text are found. This is why the Figure autoscale default is 'none'.
     # +-----------------------------------------------------------------------+
     def update_scale(self):
-        if len(self._artists) > 0 or self._color_mesh is not None:
-            if len(self._artists) == 0:
-                xdata = self._color_mesh.get_xdata()
-                ydata = self._color_mesh.get_ydata()
-            
-            else:
-                xdata = np.concatenate(tuple(
-                    artist.get_xdata() for artist in self._artists.values()
-                ))
-                ydata = np.concatenate(tuple(
-                    artist.get_ydata() for artist in self._artists.values()
-                ))
-            
-                if self._color_mesh is not None:
-                    xdata = np.concatenate((
-                        xdata, self._color_mesh.get_xdata().flatten()
-                    ))
-                    ydata = np.concatenate((
-                        ydata, self._color_mesh.get_ydata().flatten()
-                    ))
-
-            x_min, x_max = np.min(xdata), np.max(xdata)
-            y_min, y_max = np.min(ydata), np.max(ydata)
-
-            match self._autoscale:
-                case 'all':
-                    self._mpl_ax.set_xlim(x_min, x_max)
-                    self._mpl_ax.set_ylim(y_min, y_max)
-                case 'width':
-                    self._mpl_ax.set_xlim(x_min, x_max)
-                case 'height':
-                    self._mpl_ax.set_ylim(y_min, y_max)
-                case _:
-                    pass
+        if self._autoscale == 'none':
+            return
+
+        # only the extrema of the scaled dimensions are computed
+        scale_x = self._autoscale != 'height'
+        scale_y = self._autoscale != 'width'
+
+        # rebuilt on every call, so removed and overwritten artists are dropped
+        artist_bounds = {}
+        for name, artist in self._artists.items():
+            if artist.get_xdata().size > 0:
+                artist_bounds[name] = _cached_bounds(
+                    self._artist_bounds.get(name), artist, scale_x, scale_y
+                )
+        self._artist_bounds = artist_bounds
+
+        bounds = list(artist_bounds.values())
+        if self._color_mesh is not None:
+            self._mesh_bounds = _cached_bounds(
+                self._mesh_bounds, self._color_mesh, scale_x, scale_y
+            )
+            bounds.append(self._mesh_bounds)
+
+        if len(bounds) > 0:
+            if scale_x:
+                x_mins, x_maxs = zip(*(cached[1] for cached in bounds))
+                self._mpl_ax.set_xlim(min(x_mins), max(x_maxs))
+            if scale_y:
+                y_mins, y_maxs = zip(*(cached[2] for cached in bounds))
+                self._mpl_ax.set_ylim(min(y_mins), max(y_maxs))
+
+    # Clears the extrema cached by update_scale for the Artist `name`, or for
+    # all artists and the ColorMesh when no name is given.
+    def invalidate_bounds(self, name: str = None):
+        if name is None:
+            self._artist_bounds = {}
+            self._mesh_bounds = None
+            return
+
+        assert name in self._artists, e.IndexError(
+            'Figure', 'artist', action='invalidate Artist bounds'
+        )
+        self._artist_bounds.pop(name, None)
+
+    # Rebuilds the shared matplotlib artists of merged Artists that were added
+    # or removed since. This is called right before the Figure is drawn, and
+    # before its matplotlib artists are returned by get_mpl_artists.
+    def update_buckets(self):
+        for buckets, style in list(self._stale_buckets.values()):
+            self._update_bucket(buckets, style)
+
+    def draw_animated(self):
+        self.update_buckets()
+        super().draw_animated()
 
     def add_color_mesh(self, color_mesh: ColorMesh, overwrite: bool = False):
         if self._color_mesh is not None:
@@ -392,6 +715,7 @@ class Figure(_Figure):
             action='remove ColorMesh from Figure'
         )
         self._color_mesh = None
+        self._mesh_bounds = None
         self._mpl_quad_mesh.remove()
         self._mpl_quad_mesh = None
 
@@ -455,6 +779,62 @@ class Figure(_Figure):
         self.add_artist(arrows, label, overwrite)
         return arrows
 
+    # +-----------------------------------------------------------------------+
+    # scatter_batch and arrows_batch add one Artist per name, like scatter and
+    # arrows, but draw all of them with a single matplotlib artist, which is
+    # much cheaper to draw than one matplotlib artist per Artist. Artists of a
+    # batch share their visibility and Legend entry, and can still be removed
+    # one by one via Figure.remove_artist.
+    #
+    # NOTE: The colors of a batch of Arrows are normalized over the whole
+    # batch.
+    # +-----------------------------------------------------------------------+
+    def scatter_batch(
+        self,
+        xs,
+        ys,
+        names,
+        c: str = 'k',
+        s=1,
+        label: str = '',
+        overwrite: bool = False,
+    ):
+        batch = [
+            Points(x, y, name, c, s) 
+            for x, y, name in zip(xs, ys, names, strict=True)
+        ]
+        if batch:
+            self._free_batch_names(batch, overwrite)
+            mpl_path_collection = self._mpl_ax.scatter(
+                [], [], c=c, marker=batch[0].get_type()
+            )
+            self._add_batch(
+                self._scatter_buckets, mpl_path_collection, batch, label
+            )
+        return batch
+
+    def arrows_batch(
+        self,
+        xs,
+        ys,
+        us,
+        vs,
+        names,
+        c=0,
+        pivot: str = 'mid',
+        label: str = '',
+        overwrite: bool = False,
+    ):
+        batch = [
+            Arrows(x, y, u, v, name, c, pivot) 
+            for x, y, u, v, name in zip(xs, ys, us, vs, names, strict=True)
+        ]
+        if batch:
+            self._free_batch_names(batch, overwrite)
+            # the Quiver is only created once all Arrows are known
+            self._add_batch(self._quiver_buckets, None, batch, label)
+        return batch
+
     def text(
         self,
         x: int | float,
@@ -484,6 +864,10 @@ class Figure(_Figure):
         return color_mesh
 
     # ...............{ PROPERTIES                               }..............
+    def get_mpl_artists(self):
+        self.update_buckets()
+        return self._mpl_artists
+
     def get_mpl_quad_mesh(self):
         return self._mpl_quad_mesh
 
@@ -491,14 +875,34 @@ class Figure(_Figure):
         return self._autoscale
     
     def set_autoscale(self, autoscale='all'):
-        assert autoscale in Figure.AUTOSCALE_OPTIONS, e.OptionsError(
-            'Figure', 'autoscale', options=Figure.AUTOSCALE_OPTIONS
-        )
+        if autoscale not in Figure.AUTOSCALE_OPTIONS:
+            raise AssertionError(e.OptionsError(
+                'Figure', 'autoscale', options=Figure.AUTOSCALE_OPTIONS
+            ))
         self._autoscale = autoscale
         return autoscale
 
+    def get_merge(self):
+        return self._merge
+    
+    # When merge is True, Lines (and Points with a single color) that are 
+    # added afterwards share one matplotlib artist per style, which is much 
+    # cheaper to draw than one matplotlib artist per Artist. Merged Artists 
+    # of the same style share their visibility and Legend entry. A shared 
+    # matplotlib artist is only rebuilt from its Artists by update_buckets.
+    def set_merge(self, merge: bool = True):
+        self._merge = merge
+        return merge
+
 
 class Figure3D(_Figure):
+    # ...............{ CLASS VARIABLES                          }..............
+    _MPL_ADD_METHODS = {
+        Line3D: '_add_mpl_line',
+        Points3D: '_add_mpl_scatter',
+        Text3D: '_add_mpl_annotation',
+    }
+
     # ...............{ DUNDERS                                  }..............
     def __init__(
         self,
@@ -509,21 +913,15 @@ class Figure3D(_Figure):
         zlabel='',
         title='',
     ):
+        # Axes3D is only extended with annotate3D and arrow3D once 3D figures
+        # are used (this is idempotent)
+        configure_3d_artists()
         super().__init__(mpl_fig, mpl_ax, xlabel, ylabel, title)
-        mpl_ax.set_zlabel(zlabel)
+        if zlabel:
+            mpl_ax.set_zlabel(zlabel)
         self._mpl_surf = None
 
     # ...............{ PRIVATE METHODS                          }..............
-    def _add_mpl_artist(self, artist: Artist3D, label: str):
-        if isinstance(artist, Line3D):
-            self._add_mpl_line(artist, label)
-        elif isinstance(artist, Points):
-            self._add_mpl_scatter(artist, label)
-        elif isinstance(artist, Text3D):
-            self._add_mpl_annotation(artist)
-        else:
-            raise NotImplementedError()
-    
     # draws Line3D via matplotlib.pyplot.plot
     def _add_mpl_line(self, line_3d, label):
         (mpl_line,) = self._mpl_ax.plot(
@@ -550,14 +948,15 @@ class Figure3D(_Figure):
         self._mpl_artists[points_3d.get_name()] = mpl_path_collection
 
     # draws Text3D via matplotlib.pyplot.annotate3D
-    def _add_mpl_annotation(self, text):
+    def _add_mpl_annotation(self, text, label):
         mpl_annotation = self._mpl_ax.annotate3D(
             text.get_text(),
             (text.get_xdata()[0], text.get_ydata()[0], text.get_zdata()[0]),
             xytext=text.get_offset(),
             textcoords='offset points',
             color=text.get_color(),
-            fontsize=text.get_size()
+            fontsize=text.get_size(),
+            label=label
         )
         self._mpl_artists[text.get_name()] = mpl_annotation
 
@@ -671,27 +1070,55 @@ class Legend:
         figure: _Figure,
     ):
         self._figure = figure
-        self._mpl_legend = figure.get_mpl_ax().legend(handles=[])
+        # the matplotlib legend is only created once it has entries
+        self._mpl_legend = None
         self._artists = {}
-
-        self._update()
+        # (handle, label) pairs the matplotlib legend was last created from
+        self._mpl_entries = ()
+        # whether updates are deferred by Legend.batch, and whether an update 
+        # was deferred
+        self._batching = False
+        self._dirty = False
 
     # ...............{ PRIVATE METHODS                          }..............
+    # updates the Legend, unless updates are deferred by Legend.batch
+    def _request_update(self):
+        self._dirty = True
+        if not self._batching:
+            self._update()
+
     # updates the Legend by searching for current artists
     def _update(self):
-        mpl_handles = [
-            self._figure.get_mpl_artists()[name] for name in self._artists
-        ]
+        self._dirty = False
+        mpl_ax = self._figure.get_mpl_ax()
+
+        # merged Artists share a matplotlib artist, which is only listed once
+        mpl_artists = self._figure.get_mpl_artists()
+        mpl_handles = list(dict.fromkeys(
+            mpl_artists[name] for name in self._artists
+        ))
         if len(mpl_handles) > 0:
-            self._mpl_legend = self._figure.get_mpl_ax().legend(
-                handles=mpl_handles
+            # the matplotlib legend is only created again when its entries 
+            # changed or it was replaced or removed, since creating it is 
+            # expensive
+            mpl_entries = tuple(
+                (handle, handle.get_label()) for handle in mpl_handles
             )
+            if (
+                mpl_entries != self._mpl_entries
+                or self._mpl_legend is not mpl_ax.get_legend()
+            ):
+                self._mpl_legend = mpl_ax.legend(handles=mpl_handles)
+                self._mpl_entries = mpl_entries
             self._mpl_legend.set_visible(True)
-        else:
+        elif self._mpl_legend is not None:
             self._mpl_legend.set_visible(False)
 
     # ...............{ PUBLIC METHODS                           }..............
     def add(self, names: list | tuple | np.ndarray | str = 'all'):
+        artists = self._figure.get_artists()
+        text_names = self._figure.get_text_names()
+
         if isinstance(names, str):
             assert names == 'all', (
                 'Tried to add Artist to Figure Legend, but `names` is '
@@ -702,26 +1129,26 @@ class Legend:
 
             self._artists = {
                 name: artist 
-                for name, artist in self._figure.get_artists().items() 
-                if not isinstance(artist, Text)
+                for name, artist in artists.items() 
+                if name not in text_names
             }
 
         else:
-            assert all((
-                name in self._figure.get_artists() and not 
-                isinstance(self._figure.get_artists()[name], Text)
-            ) for name in names), e.IndexError(
+            assert all(
+                name in artists and name not in text_names for name in names
+            ), e.IndexError(
                 'Legend', 'artist', 
                 add_msg='Maybe Artist is of type pygraph.artists.Text.'
             )
 
-            self._artists |= {
-                name: self._figure.get_artists()[name] for name in names
-            }
+            self._artists |= {name: artists[name] for name in names}
 
-        self._update()
+        self._request_update()
 
     def remove(self, names: list | tuple | np.ndarray | str = 'all'):
+        artists = self._figure.get_artists()
+        text_names = self._figure.get_text_names()
+
         if isinstance(names, str):
             assert names == 'all', (
                 'Tried to remove Artist from Figure Legend, but `names` is '
@@ -735,8 +1162,7 @@ class Legend:
         else:
             for name in names:
                 assert (
-                    name in self._figure.get_artists() and not 
-                    isinstance(self._figure.get_artists()[name], Text)
+                    name in artists and name not in text_names
                 ), e.IndexError(
                     'Legend', 'artist', action='remove Artist from Legend',
                     add_msg='Maybe Artist is of type pygraph.artists.Text.'
@@ -744,11 +1170,65 @@ class Legend:
 
                 self._artists.pop(name)
 
-        self._update()
+        self._request_update()
         
+    # +-----------------------------------------------------------------------+
+    # Context manager deferring Legend updates, so that several calls to add
+    # and remove only rebuild the matplotlib.legend.Legend once, on exit.
+    #
+    # with figure.legend.batch():
+    #     figure.legend.add(['a', 'b'])
+    #     figure.legend.remove(['c'])
+    # +-----------------------------------------------------------------------+
+    @contextmanager
+    def batch(self):
+        batching = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = batching
+            if not batching and self._dirty:
+                self._update()
+
     # ...............{ PROPERTIES                               }..............
     def get_mpl_legend(self):
         return self._mpl_legend
         
     def get_artists(self):
-        return self._artists
\ No newline at end of file
+        return self._artists
+
+
+class _MPLBucketUpdater(martist.Artist):
+    # invisible matplotlib artist which is drawn before all other artists of 
+    # its Axes, so the shared matplotlib artists of the Figure are rebuilt 
+    # before they are drawn
+    def __init__(self, figure: Figure):
+        super().__init__()
+        self._figure = figure
+        self.set_zorder(-np.inf)
+        self.set_in_layout(False)
+
+    def draw(self, renderer):
+        self._figure.update_buckets()
+
+
+# .................{ FUNCTIONS                                }................
+def _minmax(a):
+    '''Get the minimum and maximum of the array `a`.'''
+
+    return np.min(a), np.max(a)
+
+
+def _cached_bounds(cached, obj, scale_x, scale_y):
+    '''Get `cached` as [obj, (x_min, x_max), (y_min, y_max)], computing the
+    extrema of the scaled dimensions that aren't cached yet for `obj`.
+    '''
+
+    if cached is None or cached[0] is not obj:
+        cached = [obj, None, None]
+    if scale_x and cached[1] is None:
+        cached[1] = _minmax(obj.get_xdata())
+    if scale_y and cached[2] is None:
+        cached[2] = _minmax(obj.get_ydata())
+    return cached
\ No newline at end of file